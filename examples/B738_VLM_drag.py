@@ -59,7 +59,8 @@ class B738AirplaneModel(oc.IntegratorGroup):
                      'units': 'kg/s',
                      'tags': ['integrate', 'state_name:fuel_used', 'state_units:kg', 'state_val:1.0', 'state_promotes:True']},
                   fuel_flow_in={'val': 1.0*np.ones((nn,)),
-                       'units': 'kg/s'})
+                       'units': 'kg/s'},
+                  has_diag_partials=True)
         
         self.add_subsystem('doubler', doubler, promotes_outputs=['*'])
         self.connect('propmodel.thrust', 'doubler.thrust_in')
@@ -1,10 +1,11 @@
 from __future__ import division
 import sys
 import os
+import shutil
 import logging
 import numpy as np
 sys.path.insert(0, os.getcwd())
-from openmdao.api import Problem, Group, ScipyOptimizeDriver
+from openmdao.api import Problem, Group, ScipyOptimizeDriver, DOEDriver, FullFactorialGenerator
 from openmdao.api import BalanceComp, ExplicitComponent, ExecComp, SqliteRecorder
 from openmdao.api import DirectSolver, IndepVarComp, NewtonSolver, BoundsEnforceLS
 
@@ -19,7 +20,6 @@ from examples.methods.costs_commuter import OperatingCost
 from openconcept.utilities.dict_indepvarcomp import DictIndepVarComp
 from examples.aircraft_data.KingAirC90GT import data as acdata
 from openconcept.analysis.performance.mission_profiles import FullMissionAnalysis
-from openconcept.utilities.linearinterp import LinearInterpolator
 from openconcept.utilities.visualization import plot_trajectory
 
 class AugmentedFBObjective(ExplicitComponent):
@@ -56,10 +56,6 @@ class SeriesHybridTwinModel(Group):
         else:
             controls.add_output('hybridization',val=1.0)
 
-        hybrid_factor = self.add_subsystem('hybrid_factor', LinearInterpolator(num_nodes=nn),
-                                           promotes_inputs=[('start_val', 'hybridization'),
-                                                            ('end_val', 'hybridization')])
-
         propulsion_promotes_outputs = ['fuel_flow','thrust']
         propulsion_promotes_inputs = ["fltcond|*", "ac|propulsion|*", "throttle", "propulsor_active",
                                       "ac|weights*", 'duration']
@@ -69,7 +65,9 @@ class SeriesHybridTwinModel(Group):
                            promotes_inputs=propulsion_promotes_inputs,
                            promotes_outputs=propulsion_promotes_outputs)
         self.connect('proprpm', ['propmodel.prop1.rpm', 'propmodel.prop2.rpm'])
-        self.connect('hybrid_factor.vec', 'propmodel.hybrid_split.power_split_fraction')
+        # the hybridization is constant over the segment; broadcast the scalar to every node
+        self.connect('hybridization', 'propmodel.hybrid_split.power_split_fraction',
+                     src_indices=np.zeros(nn, dtype=int))
 
         # use a different drag coefficient for takeoff versus cruise
         if flight_phase not in ['v0v1', 'v1v0', 'v1vr', 'rotate']:
@@ -167,6 +165,9 @@ class ElectricTwinAnalysisGroup(Group):
         self.connect('ac|weights|MTOW','aug_obj.ac|weights|MTOW')
         self.connect('descent.fuel_used_final','aug_obj.fuel_burn')
 
+# cruise hybridization used by the default analysis and the DOE (from a prior optimization)
+CRUISE_HYBRIDIZATION = 0.05840626452293813
+
 def configure_problem():
     prob = Problem()
     prob.model= ElectricTwinAnalysisGroup()
@@ -177,6 +178,7 @@ def configure_problem():
     prob.model.nonlinear_solver.options['maxiter'] = 10
     prob.model.nonlinear_solver.options['atol'] = 1e-7
     prob.model.nonlinear_solver.options['rtol'] = 1e-7
+    prob.model.nonlinear_solver.linesearch = BoundsEnforceLS(bound_enforcement='scalar', print_bound_enforce=False)
     return prob
 
 def set_values(prob, num_nodes, design_range, spec_energy): 
@@ -207,7 +209,7 @@ def set_values(prob, num_nodes, design_range, spec_energy):
 def run_hybrid_twin_analysis(plots=False):
     prob = configure_problem()
     prob.setup(check=False)
-    prob['cruise.hybridization'] = 0.05840626452293813
+    prob['cruise.hybridization'] = CRUISE_HYBRIDIZATION
     set_values(prob, 11, 500, 450)
     prob.run_model()
     if plots:
@@ -258,7 +260,7 @@ def show_outputs(prob):
                         plot_title='Full Mission Profile')
 
 if __name__ == "__main__":
-    # for run type choose choose optimization, comp_sizing, or analysis
+    # for run type choose choose optimization, comp_sizing, analysis, or doe
     run_type = 'example'
     num_nodes = 11
 
@@ -266,6 +268,28 @@ if __name__ == "__main__":
         # runs a default analysis-only mission (no optimization)
         run_hybrid_twin_analysis(plots=True)
 
+    elif run_type == 'doe':
+        # runs the full design range x spec energy grid as a single DOE on one problem
+        print('======Running Design Range / Specific Energy DOE============')
+        prob = configure_problem()
+        prob.model.add_design_var('mission_range', lower=300, upper=700, units='NM')
+        prob.model.add_design_var('ac|propulsion|battery|specific_energy', lower=250, upper=800, units='W*h/kg')
+
+        prob.driver = DOEDriver(FullFactorialGenerator(levels={'mission_range': 9,
+                                                               'ac|propulsion|battery|specific_energy': 12}))
+        # the DOE driver only evaluates cases, so record the outputs of interest directly
+        prob.driver.recording_options['includes'] = ['descent.propmodel.batt1.SOC_final', 'descent.fuel_used_final']
+        # with run_parallel the cases are split across MPI ranks, so launch with e.g.
+        # mpirun -np 4 python examples/HybridTwin.py (without MPI it runs serially)
+        prob.driver.options['run_parallel'] = True
+        prob.driver.add_recorder(SqliteRecorder('doe_cases.sql'))
+
+        prob.setup(check=False)
+        prob['cruise.hybridization'] = CRUISE_HYBRIDIZATION
+        set_values(prob, num_nodes, 500, 450)
+        prob.run_driver()
+        prob.cleanup()
+
     else:
         # can run a sweep of design range and spec energy (not tested)
         #design_ranges = [300,350,400,450,500,550,600,650,700]
@@ -276,6 +300,12 @@ if __name__ == "__main__":
         specific_energies = [450]
 
         write_logs = False
+        # the total derivative coloring only depends on the problem formulation,
+        # so compute it once per run type and reuse it for every case in the sweep.
+        # the saved file is keyed only on run type and num_nodes: delete it by hand
+        # after changing the model, design variables or constraints
+        coloring_dir = os.path.join('coloring_files', run_type + '_' + str(num_nodes))
+        coloring_file = os.path.join(coloring_dir, 'total_coloring.pkl')
         if write_logs:
             logging.basicConfig(filename='opt.log', filemode='w', format='%(name)s - %(levelname)s - %(message)s')
         # run a sweep of cases at various specific energies and ranges
@@ -342,6 +372,10 @@ if __name__ == "__main__":
                         prob.model.add_objective('descent.fuel_used_final')
 
                     prob.driver = ScipyOptimizeDriver()
+                    if os.path.isfile(coloring_file):
+                        prob.driver.use_fixed_coloring(coloring_file)
+                    else:
+                        prob.driver.declare_coloring()
                     if write_logs:
                         filename_to_save = 'case_'+str(spec_energy)+'_'+str(design_range)+'.sql'
                         if os.path.isfile(filename_to_save):
@@ -358,6 +392,12 @@ if __name__ == "__main__":
                     set_values(prob, num_nodes, design_range, spec_energy)
 
                     run_flag = prob.run_driver()
+                    # OpenMDAO writes a computed coloring under the problem's own output
+                    # directory; keep a copy where the next case in the sweep will look for it
+                    computed_coloring = os.path.join(prob.get_coloring_dir('output'), 'total_coloring.pkl')
+                    if not os.path.isfile(coloring_file) and os.path.isfile(computed_coloring):
+                        os.makedirs(coloring_dir, exist_ok=True)
+                        shutil.copyfile(computed_coloring, coloring_file)
                     if run_flag:
                         raise ValueError('Opt failed')
 
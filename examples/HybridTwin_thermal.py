@@ -20,7 +20,6 @@ from examples.methods.costs_commuter import OperatingCost
 from openconcept.utilities.dict_indepvarcomp import DictIndepVarComp
 from examples.aircraft_data.KingAirC90GT import data as acdata
 from openconcept.analysis.performance.mission_profiles import FullMissionAnalysis
-from openconcept.utilities.linearinterp import LinearInterpolator
 from openconcept.utilities.visualization import plot_trajectory
 
 class AugmentedFBObjective(ExplicitComponent):
@@ -58,10 +57,6 @@ class SeriesHybridTwinModel(Group):
         else:
             controls.add_output('hybridization',val=1.0)
 
-        hybrid_factor = self.add_subsystem('hybrid_factor', LinearInterpolator(num_nodes=nn),
-                                           promotes_inputs=[('start_val', 'hybridization'),
-                                                            ('end_val', 'hybridization')])
-
         propulsion_promotes_outputs = ['fuel_flow','thrust', 'ac|propulsion|thermal|duct|area_nozzle']
         propulsion_promotes_inputs = ["fltcond|*", "ac|propulsion|*", "throttle", "propulsor_active",
                                       "ac|weights*", 'duration']
@@ -71,7 +66,9 @@ class SeriesHybridTwinModel(Group):
                            promotes_inputs=propulsion_promotes_inputs,
                            promotes_outputs=propulsion_promotes_outputs)
         self.connect('proprpm', ['propmodel.prop1.rpm', 'propmodel.prop2.rpm'])
-        self.connect('hybrid_factor.vec', 'propmodel.hybrid_split.power_split_fraction')
+        # the hybridization is constant over the segment; broadcast the scalar to every node
+        self.connect('hybridization', 'propmodel.hybrid_split.power_split_fraction',
+                     src_indices=np.zeros(nn, dtype=int))
 
         # use a different drag coefficient for takeoff versus cruise
         if flight_phase not in ['v0v1', 'v1v0', 'v1vr', 'rotate']:
@@ -208,6 +205,7 @@ def configure_problem():
     prob.model.nonlinear_solver.options['maxiter'] = 10
     prob.model.nonlinear_solver.options['atol'] = 1e-8
     prob.model.nonlinear_solver.options['rtol'] = 1e-8
+    prob.model.nonlinear_solver.linesearch = BoundsEnforceLS(bound_enforcement='scalar', print_bound_enforce=False)
     return prob
 
 def set_values(prob, num_nodes, design_range, spec_energy):
@@ -1,8 +1,9 @@
 from __future__ import division
 from openconcept.components.turboshaft import SimpleTurboshaft
 from openconcept.components.propeller import SimplePropeller
+from openconcept.components.throttle import PropulsorActiveThrottle
 from openconcept.utilities.dvlabel import DVLabel
-from openconcept.utilities.math import AddSubtractComp, ElementMultiplyDivideComp
+from openconcept.utilities.math import AddSubtractComp
 from openmdao.api import Group, IndepVarComp, ExplicitComponent
 
 class TurbopropPropulsionSystem(Group):
@@ -86,9 +87,7 @@ class TwinTurbopropPropulsionSystem(Group):
         self.connect('prop_diameter','prop2.diameter')
 
         #propulsion models expect a high-level 'throttle' parameter and a 'propulsor_active' flag to set individual throttles
-        failedengine  = ElementMultiplyDivideComp()
-        failedengine.add_equation('eng2throttle',input_names=['throttle','propulsor_active'],vec_size=nn)
-        self.add_subsystem('failedengine', failedengine,
+        self.add_subsystem('failedengine', PropulsorActiveThrottle(num_nodes=nn, output_name='eng2throttle'),
                            promotes_inputs=['throttle', 'propulsor_active'])
         self.connect('failedengine.eng2throttle','eng2.throttle')
 
@@ -7,16 +7,17 @@ from openconcept.components.turboshaft import SimpleTurboshaft
 # I had to move specific energy into a design variable to get this outer loop to work correctly
 from openconcept.components.battery import SimpleBattery, SOCBattery
 from openconcept.components.propeller import SimplePropeller
+from openconcept.components.throttle import PropulsorActiveThrottle, TurbogeneratorThrottle
 from openconcept.analysis.atmospherics.compute_atmos_props import ComputeAtmosphericProperties
 from openconcept.utilities.dvlabel import DVLabel
-from openconcept.utilities.math import AddSubtractComp, ElementMultiplyDivideComp
+from openconcept.utilities.math import AddSubtractComp
 from openconcept.components.thermal import LiquidCooledComp, CoolantReservoir, ConstantSurfaceTemperatureColdPlate_NTU
 from openconcept.components.chiller import HeatPumpWithIntegratedCoolantLoop
 from openconcept.components.ducts import ImplicitCompressibleDuct, ExplicitIncompressibleDuct
 from openconcept.components.heat_exchanger import HXGroup
 
 
-from openmdao.api import Problem, Group, IndepVarComp, BalanceComp, DirectSolver, NewtonSolver, ScipyKrylov
+from openmdao.api import Problem, Group, IndepVarComp, DirectSolver, NewtonSolver, ScipyKrylov
 
 import numpy as np
 
@@ -34,17 +35,18 @@ class TwinSeriesHybridElectricPropulsionSystem(Group):
         The "pilot" controls thrust by varying the motor throttles from 0 to 100+% of rated power. She may also vary the percentage of battery versus fuel being used
         by varying the power_split_fraction
 
-        This module alone cannot produce accurate fuel flows, battery loads, etc. You must do the following, either with an implicit solver or with the optimizer:
-        - Set eng1.throttle such that gen1.elec_power_out = hybrid_split.power_out_A
+        eng_throttle_set (a TurbogeneratorThrottle) sets eng1.throttle such that gen1.elec_power_out = hybrid_split.power_out_B
 
         The battery does not track its own state of charge (SOC); it is connected to elec_load simply so that the discharge rate can be compared to the discharge rate capability of the battery.
         SOC and fuel flows should be time-integrated at a higher level (in the mission analysis codes)
 
-        Arrows show flow of information. In openConcept, mechanical power operates on a 'push' basis, while electrical load operates on a 'pull' basis. We reconcile these flows across an implicit gap by driving a residual to 0 using a solver.
+        battery_load is hybrid_split.power_out_A promoted under a new name, so it is in W (it used to be a kW label). Use units='kW' when reading it to get the old values.
 
-        eng1.throttle                                                           hybrid_split.power_split_fraction           motor1.throttle
-            ||                                                                                   ||                             ||
-        eng1 --shaft_power_out--> gen1 --elec_power_out--> {IMPLICIT GAP} <--power_out_B         ||           <--elec_load-- motor1 --shaft_power_out --> prop1 -->thrust
+        Arrows show flow of information. In openConcept, mechanical power operates on a 'push' basis, while electrical load operates on a 'pull' basis.
+
+        eng1.throttle <--eng_throttle_set--                                     hybrid_split.power_split_fraction           motor1.throttle
+            ||                            ||                                                     ||                             ||
+        eng1 --shaft_power_out--> gen1    ++-------------------------------------<--power_out_B  ||           <--elec_load-- motor1 --shaft_power_out --> prop1 -->thrust
            ||                                                                             hybrid_split <--elec_load  ++
            ||                                            batt1.elec_load <--power_out_A                       <--elec_load-- motor2 --shaft_power_out --> prop2 -->thrust
             V                                                                   V                                              ||
@@ -82,9 +84,7 @@ class TwinSeriesHybridElectricPropulsionSystem(Group):
         self.connect('motor1.shaft_power_out','prop1.shaft_power_in')
 
         #propulsion models expect a high-level 'throttle' parameter and a 'propulsor_active' flag to set individual throttles
-        failedengine  = ElementMultiplyDivideComp()
-        failedengine.add_equation('motor2throttle',input_names=['throttle','propulsor_active'],vec_size=nn)
-        self.add_subsystem('failedmotor', failedengine,
+        self.add_subsystem('failedmotor', PropulsorActiveThrottle(num_nodes=nn, output_name='motor2throttle'),
                            promotes_inputs=['throttle', 'propulsor_active'])
 
         self.add_subsystem('motor2', SimpleMotor(efficiency=0.97,num_nodes=nn))
@@ -94,38 +94,34 @@ class TwinSeriesHybridElectricPropulsionSystem(Group):
 
 
 
-        addpower = AddSubtractComp(output_name='motors_elec_load',input_names=['motor1_elec_load','motor2_elec_load'], units='kW',vec_size=nn)
-        addpower.add_equation(output_name='thrust',input_names=['prop1_thrust','prop2_thrust'], units='N',vec_size=nn)
-        self.add_subsystem('add_power',subsys=addpower,promotes_outputs=['*'])
-        self.connect('motor1.elec_load','add_power.motor1_elec_load')
-        self.connect('motor2.elec_load','add_power.motor2_elec_load')
-        self.connect('prop1.thrust','add_power.prop1_thrust')
-        self.connect('prop2.thrust','add_power.prop2_thrust')
+        #add up the electrical loads, thrusts, weights and heat loads in a single component
+        adder = AddSubtractComp(output_name='motors_elec_load',input_names=['motor1_elec_load','motor2_elec_load'], units='kW',vec_size=nn)
+        adder.add_equation(output_name='thrust',input_names=['prop1_thrust','prop2_thrust'], units='N',vec_size=nn)
+        adder.add_equation(output_name='motors_weight',input_names=['motor1_weight','motor2_weight'], units='kg')
+        adder.add_equation(output_name='propellers_weight',input_names=['prop1_weight','prop2_weight'], units='kg')
+        adder.add_equation(output_name='motors_heat',input_names=['motor1_heat','motor2_heat'], vec_size=nn, units='W')
+        self.add_subsystem('adder',subsys=adder,promotes_inputs=['*'],promotes_outputs=['*'])
+        self.connect('motor1.elec_load','motor1_elec_load')
+        self.connect('motor2.elec_load','motor2_elec_load')
+        self.connect('prop1.thrust','prop1_thrust')
+        self.connect('prop2.thrust','prop2_thrust')
 
-        self.add_subsystem('hybrid_split',PowerSplit(rule='fraction',num_nodes=nn))
+        self.add_subsystem('hybrid_split',PowerSplit(rule='fraction',num_nodes=nn),
+                           promotes_outputs=[('power_out_A','battery_load')])
         self.connect('motors_elec_load','hybrid_split.power_in')
 
+        gen_efficiency = 0.97
+        self.add_subsystem('eng_throttle_set',TurbogeneratorThrottle(num_nodes=nn,efficiency=gen_efficiency))
+        self.connect('hybrid_split.power_out_B','eng_throttle_set.elec_power_required')
+        self.connect('eng_throttle_set.throttle','eng1.throttle')
+
         self.add_subsystem('eng1',SimpleTurboshaft(num_nodes=nn,weight_inc=0.14/1000,weight_base=104),promotes_outputs=["fuel_flow"])
-        self.add_subsystem('gen1',SimpleGenerator(efficiency=0.97,num_nodes=nn))
+        self.add_subsystem('gen1',SimpleGenerator(efficiency=gen_efficiency,num_nodes=nn))
 
         self.connect('eng1.shaft_power_out','gen1.shaft_power_in')
 
         self.add_subsystem('batt1', SOCBattery(num_nodes=nn, efficiency=0.97),promotes_inputs=["duration",'specific_energy'])
-        self.connect('hybrid_split.power_out_A','batt1.elec_load')
-        # TODO set val= right number of nn
-        self.add_subsystem('eng_throttle_set',BalanceComp(name='eng_throttle', val=np.ones((nn,))*0.5, units=None, eq_units='kW', rhs_name='gen_power_required',lhs_name='gen_power_available'))
-        #need to use the optimizer to drive hybrid_split.power_out_B to the same value as gen1.elec_power_out
-        self.connect('hybrid_split.power_out_B','eng_throttle_set.gen_power_required')
-        self.connect('gen1.elec_power_out','eng_throttle_set.gen_power_available')
-        self.connect('eng_throttle_set.eng_throttle','eng1.throttle')
-
-        adder = AddSubtractComp(output_name='motors_weight',input_names=['motor1_weight','motor2_weight'], units='kg')
-        adder.add_equation(output_name='propellers_weight',input_names=['prop1_weight','prop2_weight'], units='kg')
-        adder.add_equation(output_name='motors_heat',input_names=['motor1_heat','motor2_heat'], vec_size=nn, units='W')
-        self.add_subsystem('adder',subsys=adder,promotes_inputs=['*'],promotes_outputs=['*'])
-        relabel = [['hybrid_split_A_in','battery_load',np.ones(nn)*260.0,'kW']]
-        self.add_subsystem('relabel',DVLabel(relabel),promotes_outputs=["battery_load"])
-        self.connect('hybrid_split.power_out_A','relabel.hybrid_split_A_in')
+        self.connect('battery_load','batt1.elec_load')
 
         self.connect('motor1.component_weight','motor1_weight')
         self.connect('motor2.component_weight','motor2_weight')
@@ -135,7 +131,7 @@ class TwinSeriesHybridElectricPropulsionSystem(Group):
         self.connect('motor2.heat_out','motor2_heat')
 
         #connect design variables to model component inputs
-        self.connect('eng_rating','eng1.shaft_power_rating')
+        self.connect('eng_rating',['eng1.shaft_power_rating','eng_throttle_set.shaft_power_rating'])
         self.connect('prop_diameter',['prop1.diameter','prop2.diameter'])
         self.connect('motor_rating',['motor1.elec_power_rating','motor2.elec_power_rating'])
         self.connect('motor_rating',['prop1.power_rating','prop2.power_rating'])
@@ -199,17 +195,18 @@ class TwinSeriesHybridElectricPropulsionRefrigerated(Group):
         The "pilot" controls thrust by varying the motor throttles from 0 to 100+% of rated power. She may also vary the percentage of battery versus fuel being used
         by varying the power_split_fraction
 
-        This module alone cannot produce accurate fuel flows, battery loads, etc. You must do the following, either with an implicit solver or with the optimizer:
-        - Set eng1.throttle such that gen1.elec_power_out = hybrid_split.power_out_A
+        eng_throttle_set (a TurbogeneratorThrottle) sets eng1.throttle such that gen1.elec_power_out = hybrid_split.power_out_B
 
         The battery does not track its own state of charge (SOC); it is connected to elec_load simply so that the discharge rate can be compared to the discharge rate capability of the battery.
         SOC and fuel flows should be time-integrated at a higher level (in the mission analysis codes)
 
-        Arrows show flow of information. In openConcept, mechanical power operates on a 'push' basis, while electrical load operates on a 'pull' basis. We reconcile these flows across an implicit gap by driving a residual to 0 using a solver.
+        battery_load is hybrid_split.power_out_A promoted under a new name, so it is in W (it used to be a kW label). Use units='kW' when reading it to get the old values.
 
-        eng1.throttle                                                           hybrid_split.power_split_fraction           motor1.throttle
-            ||                                                                                   ||                             ||
-        eng1 --shaft_power_out--> gen1 --elec_power_out--> {IMPLICIT GAP} <--power_out_B         ||           <--elec_load-- motor1 --shaft_power_out --> prop1 -->thrust
+        Arrows show flow of information. In openConcept, mechanical power operates on a 'push' basis, while electrical load operates on a 'pull' basis.
+
+        eng1.throttle <--eng_throttle_set--                                     hybrid_split.power_split_fraction           motor1.throttle
+            ||                            ||                                                     ||                             ||
+        eng1 --shaft_power_out--> gen1    ++-------------------------------------<--power_out_B  ||           <--elec_load-- motor1 --shaft_power_out --> prop1 -->thrust
            ||                                                                             hybrid_split <--elec_load  ++
            ||                                            batt1.elec_load <--power_out_A                       <--elec_load-- motor2 --shaft_power_out --> prop2 -->thrust
             V                                                                   V                                              ||
@@ -249,9 +246,7 @@ class TwinSeriesHybridElectricPropulsionRefrigerated(Group):
         self.connect('motor1.shaft_power_out','prop1.shaft_power_in')
 
         #propulsion models expect a high-level 'throttle' parameter and a 'propulsor_active' flag to set individual throttles
-        failedengine  = ElementMultiplyDivideComp()
-        failedengine.add_equation('motor2throttle',input_names=['throttle','propulsor_active'],vec_size=nn)
-        self.add_subsystem('failedmotor', failedengine,
+        self.add_subsystem('failedmotor', PropulsorActiveThrottle(num_nodes=nn, output_name='motor2throttle'),
                            promotes_inputs=['throttle', 'propulsor_active'])
 
         self.add_subsystem('motor2', SimpleMotor(efficiency=0.97,num_nodes=nn))
@@ -259,41 +254,36 @@ class TwinSeriesHybridElectricPropulsionRefrigerated(Group):
         self.connect('motor2.shaft_power_out','prop2.shaft_power_in')
         self.connect('failedmotor.motor2throttle','motor2.throttle')
 
-        addpower = AddSubtractComp(output_name='total_elec_load',
-                                   input_names=['motor1_elec_load','motor2_elec_load', 'refrig_elec_load'], units='kW',vec_size=nn)
-        addpower.add_equation(output_name='thrust',input_names=['prop1_thrust','prop2_thrust'], units='N',vec_size=nn)
-        self.add_subsystem('add_power',subsys=addpower,promotes_outputs=['*'])
-        self.connect('motor1.elec_load','add_power.motor1_elec_load')
-        self.connect('motor2.elec_load','add_power.motor2_elec_load')
-        self.connect('prop1.thrust','add_power.prop1_thrust')
-        self.connect('prop2.thrust','add_power.prop2_thrust')
+        #add up the electrical loads, thrusts, weights and heat loads in a single component
+        adder = AddSubtractComp(output_name='total_elec_load',
+                                input_names=['motor1_elec_load','motor2_elec_load', 'refrig_elec_load'], units='kW',vec_size=nn)
+        adder.add_equation(output_name='thrust',input_names=['prop1_thrust','prop2_thrust'], units='N',vec_size=nn)
+        adder.add_equation(output_name='motors_weight',input_names=['motor1_weight','motor2_weight'], units='kg')
+        adder.add_equation(output_name='propellers_weight',input_names=['prop1_weight','prop2_weight'], units='kg')
+        adder.add_equation(output_name='motors_heat',input_names=['motor1_heat','motor2_heat'], vec_size=nn, units='W')
+        self.add_subsystem('adder',subsys=adder,promotes_inputs=['*'],promotes_outputs=['*'])
+        self.connect('motor1.elec_load','motor1_elec_load')
+        self.connect('motor2.elec_load','motor2_elec_load')
+        self.connect('prop1.thrust','prop1_thrust')
+        self.connect('prop2.thrust','prop2_thrust')
 
 
-        self.add_subsystem('hybrid_split',PowerSplit(rule='fraction',num_nodes=nn))
+        self.add_subsystem('hybrid_split',PowerSplit(rule='fraction',num_nodes=nn),
+                           promotes_outputs=[('power_out_A','battery_load')])
         self.connect('total_elec_load','hybrid_split.power_in')
 
+        gen_efficiency = 0.97
+        self.add_subsystem('eng_throttle_set',TurbogeneratorThrottle(num_nodes=nn,efficiency=gen_efficiency))
+        self.connect('hybrid_split.power_out_B','eng_throttle_set.elec_power_required')
+        self.connect('eng_throttle_set.throttle','eng1.throttle')
+
         self.add_subsystem('eng1',SimpleTurboshaft(num_nodes=nn,weight_inc=0.14/1000,weight_base=104),promotes_outputs=["fuel_flow"])
-        self.add_subsystem('gen1',SimpleGenerator(efficiency=0.97,num_nodes=nn))
+        self.add_subsystem('gen1',SimpleGenerator(efficiency=gen_efficiency,num_nodes=nn))
 
         self.connect('eng1.shaft_power_out','gen1.shaft_power_in')
 
         self.add_subsystem('batt1', SOCBattery(num_nodes=nn, efficiency=0.97),promotes_inputs=["duration",'specific_energy'])
-        self.connect('hybrid_split.power_out_A','batt1.elec_load')
-        # TODO set val= right number of nn
-        self.add_subsystem('eng_throttle_set',BalanceComp(name='eng_throttle', val=np.ones((nn,))*0.5, units=None, eq_units='kW',
-                                                          rhs_name='gen_power_required',lhs_name='gen_power_available'))
-        #need to use the optimizer to drive hybrid_split.power_out_B to the same value as gen1.elec_power_out
-        self.connect('hybrid_split.power_out_B','eng_throttle_set.gen_power_required')
-        self.connect('gen1.elec_power_out','eng_throttle_set.gen_power_available')
-        self.connect('eng_throttle_set.eng_throttle','eng1.throttle')
-
-        adder = AddSubtractComp(output_name='motors_weight',input_names=['motor1_weight','motor2_weight'], units='kg')
-        adder.add_equation(output_name='propellers_weight',input_names=['prop1_weight','prop2_weight'], units='kg')
-        adder.add_equation(output_name='motors_heat',input_names=['motor1_heat','motor2_heat'], vec_size=nn, units='W')
-        self.add_subsystem('adder',subsys=adder,promotes_inputs=['*'],promotes_outputs=['*'])
-        relabel = [['hybrid_split_A_in','battery_load',np.ones(nn)*260.0,'kW']]
-        self.add_subsystem('relabel',DVLabel(relabel),promotes_outputs=["battery_load"])
-        self.connect('hybrid_split.power_out_A','relabel.hybrid_split_A_in')
+        self.connect('battery_load','batt1.elec_load')
 
         self.connect('motor1.component_weight','motor1_weight')
         self.connect('motor2.component_weight','motor2_weight')
@@ -303,7 +293,7 @@ class TwinSeriesHybridElectricPropulsionRefrigerated(Group):
         self.connect('motor2.heat_out','motor2_heat')
 
         #connect design variables to model component inputs
-        self.connect('eng_rating','eng1.shaft_power_rating')
+        self.connect('eng_rating',['eng1.shaft_power_rating','eng_throttle_set.shaft_power_rating'])
         self.connect('prop_diameter',['prop1.diameter','prop2.diameter'])
         self.connect('motor_rating',['motor1.elec_power_rating','motor2.elec_power_rating'])
         self.connect('motor_rating',['prop1.power_rating','prop2.power_rating'])
@@ -320,7 +310,7 @@ class TwinSeriesHybridElectricPropulsionRefrigerated(Group):
         # so it pulls power from both the battery and turboshaft at the hybridization ratio.
         # Bypass the refrigeration with refrig.control.bypass_start and refrig.control.bypass_end
         self.add_subsystem('refrig', HeatPumpWithIntegratedCoolantLoop(num_nodes=nn))
-        self.connect('refrig.elec_load', 'add_power.refrig_elec_load')
+        self.connect('refrig.elec_load', 'refrig_elec_load')
         self.connect('refrig_eff_factor', 'refrig.eff_factor')
         self.connect('refrig_rating', 'refrig.power_rating')
         self.connect('refrig_spec_pow', 'refrig.specific_power')
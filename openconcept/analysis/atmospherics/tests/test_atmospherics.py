@@ -15,7 +15,7 @@ class AtmosTestGroup(Group):
         iv = self.add_subsystem('conditions', IndepVarComp())
         self.add_subsystem('atmos', ComputeAtmosphericProperties(num_nodes=nn),promotes_outputs=['*'])
         iv.add_output('h', val=np.linspace(0,30000,nn), units='ft')
-        iv.add_output('Ueas', val=np.ones(nn)*120, units='kn')
+        iv.add_output('Ueas', val=np.full(nn, 120.), units='kn')
         self.connect('conditions.h','atmos.fltcond|h')
         self.connect('conditions.Ueas','atmos.fltcond|Ueas')
 
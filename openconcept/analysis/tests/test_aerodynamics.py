@@ -16,7 +16,7 @@ class PolarDragTestGroup(Group):
         self.add_subsystem('polardrag', PolarDrag(num_nodes=nn),promotes_inputs=['*'],promotes_outputs=['*'])
 
         iv.add_output('fltcond|CL', val=np.linspace(0,1.5,nn))
-        iv.add_output('fltcond|q', val=np.ones(nn)*0.5*1.225*70**2, units='N * m**-2')
+        iv.add_output('fltcond|q', val=np.full(nn, 0.5*1.225*70**2), units='N * m**-2')
         iv.add_output('ac|geom|wing|S_ref', val=30, units='m**2')
         iv.add_output('ac|geom|wing|AR', val=15)
         iv.add_output('CD0', val=0.02)
@@ -65,7 +65,7 @@ class LiftTestGroup(Group):
         self.add_subsystem('lift', Lift(num_nodes=nn),promotes_inputs=['*'],promotes_outputs=['*'])
 
         iv.add_output('fltcond|CL', val=np.linspace(1.5,0,nn))
-        iv.add_output('fltcond|q', val=np.ones(nn)*0.5*1.225*70**2, units='N * m**-2')
+        iv.add_output('fltcond|q', val=np.full(nn, 0.5*1.225*70**2), units='N * m**-2')
         iv.add_output('ac|geom|wing|S_ref', val=30, units='m**2')
 
 class VectorLiftTestCase(unittest.TestCase):
@@ -126,8 +126,8 @@ class TestForDocs(unittest.TestCase):
         # set the initial value of the state at the beginning of the TrajectoryGroup
         prob['phase1.vm.ode_integ.velocity_initial'] = 10.0
         prob.run_model()
-        prob.model.list_outputs(print_arrays=True, units=True)
-        prob.model.list_inputs(print_arrays=True, units=True)
+        # prob.model.list_outputs(print_arrays=True, units=True)
+        # prob.model.list_inputs(print_arrays=True, units=True)
         
         return prob
 
@@ -4,3 +4,4 @@ from .motor import SimpleMotor
 from .propeller import SimplePropeller
 from .splitter import PowerSplit, FlowSplit, FlowCombine
 from .turboshaft import SimpleTurboshaft
+from .throttle import PropulsorActiveThrottle, TurbogeneratorThrottle
@@ -65,8 +65,8 @@ class ExplicitIncompressibleDuct(ExplicitComponent):
         # self.declare_partials(['drag','mdot'],['fltcond|Utrue','fltcond|rho','delta_p_hex'],rows=np.arange(nn),cols=np.arange(nn))
         # self.declare_partials(['drag','mdot'],['area_nozzle'],rows=np.arange(nn),cols=np.zeros((nn,)))
 
-        self.declare_partials(['drag','mdot'],['fltcond|Utrue','fltcond|rho','delta_p_hex'],method='cs')
-        self.declare_partials(['drag','mdot'],['area_nozzle'],method='cs')
+        self.declare_partials(['drag','mdot'],['fltcond|Utrue','fltcond|rho','delta_p_hex','area_nozzle'],
+                              rows=np.arange(nn),cols=np.arange(nn),method='cs')
 
     def compute(self, inputs, outputs):
         static_pressure_loss_factor = self.options['static_pressure_loss_factor']
@@ -234,7 +234,7 @@ class PressureIsentropic(ExplicitComponent):
         self.add_input('pt', shape=(nn,),  units='Pa')
         self.add_input('M', shape=(nn,))
         self.add_output('p', shape=(nn,),  units='Pa')
-        self.declare_partials(['*'], ['*'], method='cs')
+        self.declare_partials(['*'], ['*'], rows=np.arange(nn), cols=np.arange(nn), method='cs')
 
     def compute(self, inputs, outputs):
         nn = self.options['num_nodes']
@@ -324,7 +324,7 @@ class DensityIdealGas(ExplicitComponent):
         self.add_input('p', shape=(nn,),  units='Pa')
         self.add_input('T', shape=(nn,), units='K')
         self.add_output('rho', shape=(nn,),  units='kg/m**3')
-        self.declare_partials(['*'], ['*'], method='cs')
+        self.declare_partials(['*'], ['*'], rows=np.arange(nn), cols=np.arange(nn), method='cs')
 
     def compute(self, inputs, outputs):
         nn = self.options['num_nodes']
@@ -412,7 +412,7 @@ class MachNumberfromSpeed(ExplicitComponent):
         self.add_input('a', shape=(nn,), units='m/s')
         self.add_input('Utrue', shape=(nn,), units='m/s')
         self.add_output('M', shape=(nn,))
-        self.declare_partials(['*'], ['*'], method='cs')
+        self.declare_partials(['*'], ['*'], rows=np.arange(nn), cols=np.arange(nn), method='cs')
 
     def compute(self, inputs, outputs):
         nn = self.options['num_nodes']
@@ -660,7 +660,7 @@ class DuctExitMachNumber(ExplicitComponent):
         gam = self.options['gamma']
         self.add_input('nozzle_pressure_ratio', shape=(nn,))
         self.add_output('M', shape=(nn,))
-        self.declare_partials(['*'], ['*'], method='cs')
+        self.declare_partials(['*'], ['*'], rows=np.arange(nn), cols=np.arange(nn), method='cs')
 
     def compute(self, inputs, outputs):
         nn = self.options['num_nodes']
@@ -714,7 +714,7 @@ class NetForce(ExplicitComponent):
         self.add_input('rho_nozzle', shape=(nn,), units='kg/m**3')
 
         self.add_output('F_net', shape=(nn,), units='N')
-        self.declare_partials(['*'], ['*'], method='cs')
+        self.declare_partials(['*'], ['*'], rows=np.arange(nn), cols=np.arange(nn), method='cs')
 
     def compute(self, inputs, outputs):
         nn = self.options['num_nodes']
@@ -81,7 +81,8 @@ class HeatPipe(Group):
         # Used ExecComp here because multiplying vector and scalar inputs
         self.add_subsystem('heat_divide', ExecComp('q_div = q / n_pipes',
                                                         q_div={'units': 'W', 'shape': (nn,)},
-                                                        q={'units': 'W', 'shape': (nn,)}),
+                                                        q={'units': 'W', 'shape': (nn,)},
+                                                        has_diag_partials=True),
                            promotes_inputs=['q', 'n_pipes'])
 
         # Maximum heat transfer and weight
@@ -101,7 +102,8 @@ class HeatPipe(Group):
         # Used ExecComp here because multiplying vector and scalar inputs
         self.add_subsystem('q_max_multiplier', ExecComp('q_max = single_pipe_q_max * n_pipes',
                                                         q_max={'units': 'W', 'shape': (nn,)},
-                                                        single_pipe_q_max={'units': 'W', 'shape': (nn,)}),
+                                                        single_pipe_q_max={'units': 'W', 'shape': (nn,)},
+                                                        has_diag_partials=True),
                            promotes_inputs=['n_pipes'], promotes_outputs=['q_max'])
         self.connect('q_max_calc.q_max', 'q_max_multiplier.single_pipe_q_max')
 
@@ -129,7 +131,8 @@ class HeatPipe(Group):
         self.add_subsystem('cond_temp_calc', ExecComp('T_cond = T_evap - q*R', T_cond={'units': 'degC', 'shape': (nn,)},
                                                                                T_evap={'units': 'degC', 'shape': (nn,)},
                                                                                q={'units': 'W', 'shape': (nn,)},
-                                                                               R={'units': 'K/W', 'shape': (nn,)}),
+                                                                               R={'units': 'K/W', 'shape': (nn,)},
+                                                                               has_diag_partials=True),
                            promotes_inputs=['T_evap'], promotes_outputs=['T_cond'])
         self.connect('heat_divide.q_div', ['delta_T_calc.q', 'resistance.q', 'cond_temp_calc.q'])
         self.connect('resistance.thermal_resistance', 'cond_temp_calc.R')
@@ -4,6 +4,7 @@ import numpy as np
 from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials
 from openmdao.api import IndepVarComp, Group, Problem
 from openconcept.components import SimpleBattery, SimpleGenerator, SimpleMotor, SimplePropeller, SimpleTurboshaft, PowerSplit
+from openconcept.components import PropulsorActiveThrottle, TurbogeneratorThrottle
 
 class BatteryTestGroup(Group):
     """
@@ -38,7 +39,7 @@ class BatteryTestGroup(Group):
 
         iv = self.add_subsystem('iv', IndepVarComp())
         iv.add_output('battery_weight', val=100, units='kg')
-        iv.add_output('elec_load', val=np.ones(nn) * 100, units='kW')
+        iv.add_output('elec_load', val=np.full(nn, 100.), units='kW')
         self.connect('iv.battery_weight','battery.battery_weight')
         self.connect('iv.elec_load','battery.elec_load')
 
@@ -75,7 +76,7 @@ class MotorTestGroup(Group):
 
         iv = self.add_subsystem('iv', IndepVarComp())
         iv.add_output('elec_power_rating', val=100, units='kW')
-        iv.add_output('throttle', val=np.ones(nn)*0.9)
+        iv.add_output('throttle', val=np.full(nn, 0.9))
         self.connect('iv.elec_power_rating','motor.elec_power_rating')
         self.connect('iv.throttle','motor.throttle')
 
@@ -112,7 +113,7 @@ class GeneratorTestGroup(Group):
 
         iv = self.add_subsystem('iv', IndepVarComp())
         iv.add_output('elec_power_rating', val=100, units='kW')
-        iv.add_output('shaft_power_in', val=np.ones(nn)*90, units='kW')
+        iv.add_output('shaft_power_in', val=np.full(nn, 90.), units='kW')
         self.connect('iv.elec_power_rating','generator.elec_power_rating')
         self.connect('iv.shaft_power_in','generator.shaft_power_in')
 
@@ -149,10 +150,44 @@ class TurboshaftTestGroup(Group):
 
         iv = self.add_subsystem('iv', IndepVarComp())
         iv.add_output('shaft_power_rating', val=1000, units='hp')
-        iv.add_output('throttle', val=np.ones(nn)*0.90)
+        iv.add_output('throttle', val=np.full(nn, 0.90))
         self.connect('iv.shaft_power_rating','turboshaft.shaft_power_rating')
         self.connect('iv.throttle','turboshaft.throttle')
 
+class PropulsorActiveThrottleTestGroup(Group):
+    """
+    Test the propulsor active throttle component
+    """
+    def initialize(self):
+        self.options.declare('vec_size',default=1,desc="Number of mission analysis points to run")
+
+    def setup(self):
+        nn = self.options['vec_size']
+        self.add_subsystem('failed', PropulsorActiveThrottle(num_nodes=nn, output_name='eng2throttle'))
+
+        iv = self.add_subsystem('iv', IndepVarComp())
+        iv.add_output('throttle', val=np.linspace(0.1, 1.0, nn))
+        iv.add_output('propulsor_active', val=np.ones(nn))
+        self.connect('iv.throttle','failed.throttle')
+        self.connect('iv.propulsor_active','failed.propulsor_active')
+
+class TurbogeneratorThrottleTestGroup(Group):
+    """
+    Test the turbogenerator throttle component
+    """
+    def initialize(self):
+        self.options.declare('vec_size',default=1,desc="Number of mission analysis points to run")
+
+    def setup(self):
+        nn = self.options['vec_size']
+        self.add_subsystem('throttle', TurbogeneratorThrottle(num_nodes=nn, efficiency=0.97))
+
+        iv = self.add_subsystem('iv', IndepVarComp())
+        iv.add_output('elec_power_required', val=np.linspace(50, 200, nn), units='kW')
+        iv.add_output('shaft_power_rating', val=250, units='kW')
+        self.connect('iv.elec_power_required','throttle.elec_power_required')
+        self.connect('iv.shaft_power_rating','throttle.shaft_power_rating')
+
 class SimpleBatteryTestCase(unittest.TestCase):
 
     def test_default_settings(self):
@@ -286,4 +321,47 @@ class SimpleTurboshaftTestCase(unittest.TestCase):
         assert_near_equal(prob.get_val('turboshaft.component_cost', units='USD'), 1e6+50000., tolerance=1e-6)
         assert_near_equal(prob.get_val('turboshaft.component_weight', units='kg'), 1050, tolerance=1e-10)
         partials = prob.check_partials(method='cs',compact_print=True)
-        assert_check_partials(partials)
\ No newline at end of file
+        assert_check_partials(partials)
+
+class PropulsorActiveThrottleTestCase(unittest.TestCase):
+
+    def test_active(self):
+        prob = Problem(PropulsorActiveThrottleTestGroup(vec_size=10))
+        prob.setup(check=True,force_alloc_complex=True)
+        prob.run_model()
+        assert_near_equal(prob['failed.eng2throttle'], np.linspace(0.1, 1.0, 10), tolerance=1e-15)
+        partials = prob.check_partials(method='cs',compact_print=True)
+        assert_check_partials(partials)
+
+    def test_failed(self):
+        prob = Problem(PropulsorActiveThrottleTestGroup(vec_size=10))
+        prob.setup(check=True,force_alloc_complex=True)
+        prob['iv.propulsor_active'] = np.zeros(10)
+        prob.run_model()
+        assert_near_equal(prob['failed.eng2throttle'], np.zeros(10), tolerance=1e-15)
+        partials = prob.check_partials(method='cs',compact_print=True)
+        assert_check_partials(partials)
+
+class TurbogeneratorThrottleTestCase(unittest.TestCase):
+
+    def test_default_settings(self):
+        prob = Problem(TurbogeneratorThrottleTestGroup(vec_size=10))
+        prob.setup(check=True,force_alloc_complex=True)
+        prob.run_model()
+        assert_near_equal(prob['throttle.throttle'], np.linspace(50, 200, 10)/250/0.97, tolerance=1e-15)
+        partials = prob.check_partials(method='cs',compact_print=True)
+        assert_check_partials(partials)
+
+    def test_matches_turbogenerator(self):
+        # the inverted throttle drives a turboshaft and generator to the required power
+        model = Group()
+        model.add_subsystem('test', TurbogeneratorThrottleTestGroup(vec_size=10))
+        model.add_subsystem('eng', SimpleTurboshaft(num_nodes=10))
+        model.add_subsystem('gen', SimpleGenerator(num_nodes=10, efficiency=0.97))
+        model.connect('test.throttle.throttle','eng.throttle')
+        model.connect('test.iv.shaft_power_rating','eng.shaft_power_rating')
+        model.connect('eng.shaft_power_out','gen.shaft_power_in')
+        prob = Problem(model)
+        prob.setup(check=True)
+        prob.run_model()
+        assert_near_equal(prob.get_val('gen.elec_power_out', units='kW'), np.linspace(50, 200, 10), tolerance=1e-14)
@@ -0,0 +1,103 @@
+from __future__ import division
+import numpy as np
+from openmdao.api import ExplicitComponent
+
+
+class PropulsorActiveThrottle(ExplicitComponent):
+    """
+    Throttle setting seen by a propulsor which may be failed (e.g. the critical engine
+    in an engine-out condition).
+
+    Inputs
+    ------
+    throttle : float
+        High-level throttle setting. (vector, dimensionless)
+    propulsor_active : float
+        1 if the propulsor is operating, 0 if it has failed. (vector, dimensionless)
+
+    Outputs
+    -------
+    active_throttle : float
+        Throttle setting fed to the propulsor (vector, dimensionless).
+        The output name can be changed with the ``output_name`` option.
+
+    Options
+    -------
+    num_nodes : int
+        Number of analysis points to run (sets vec length; default 1)
+    output_name : str
+        Name of the output variable (default 'active_throttle')
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', default=1, desc='Number of flight/control conditions')
+        self.options.declare('output_name', default='active_throttle', desc='Name of the output')
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        output_name = self.options['output_name']
+        self.add_input('throttle', desc='Throttle input (Fractional)', shape=(nn,))
+        self.add_input('propulsor_active', val=1.0, desc='1 if propulsor is active, 0 if failed', shape=(nn,))
+        self.add_output(output_name, desc='Throttle setting of the propulsor', shape=(nn,))
+        self.declare_partials(output_name, ['throttle', 'propulsor_active'],
+                              rows=np.arange(nn), cols=np.arange(nn))
+
+    def compute(self, inputs, outputs):
+        output_name = self.options['output_name']
+        np.multiply(inputs['throttle'], inputs['propulsor_active'], out=outputs[output_name])
+
+    def compute_partials(self, inputs, J):
+        output_name = self.options['output_name']
+        J[output_name, 'throttle'] = inputs['propulsor_active']
+        J[output_name, 'propulsor_active'] = inputs['throttle']
+
+
+class TurbogeneratorThrottle(ExplicitComponent):
+    """
+    Turboshaft throttle setting which makes a turboshaft-driven generator produce
+    a required electrical power.
+
+    SimpleTurboshaft shaft power and SimpleGenerator electrical power are both linear
+    in throttle, so the throttle is found in closed form rather than with a solver.
+
+    Inputs
+    ------
+    elec_power_required : float
+        Electrical power the generator must produce (vector, W)
+    shaft_power_rating : float
+        Rated power of the turboshaft (scalar, W)
+
+    Outputs
+    -------
+    throttle : float
+        Turboshaft throttle setting (vector, dimensionless)
+
+    Options
+    -------
+    num_nodes : int
+        Number of analysis points to run (sets vec length; default 1)
+    efficiency : float
+        Generator efficiency. Sensible range 0.0 to 1.0 (default 1)
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', default=1, desc='Number of flight/control conditions')
+        self.options.declare('efficiency', default=1., desc='Generator efficiency (dimensionless)')
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        self.add_input('elec_power_required', units='W', desc='Required generator output power', shape=(nn,))
+        self.add_input('shaft_power_rating', units='W', desc='Turboshaft rated power')
+        self.add_output('throttle', desc='Turboshaft throttle setting', shape=(nn,))
+        self.declare_partials('throttle', 'elec_power_required', rows=np.arange(nn), cols=np.arange(nn))
+        self.declare_partials('throttle', 'shaft_power_rating')
+
+    def compute(self, inputs, outputs):
+        eta_g = self.options['efficiency']
+        outputs['throttle'] = inputs['elec_power_required'] / (inputs['shaft_power_rating'] * eta_g)
+
+    def compute_partials(self, inputs, J):
+        nn = self.options['num_nodes']
+        eta_g = self.options['efficiency']
+        J['throttle', 'elec_power_required'] = np.ones(nn) / (inputs['shaft_power_rating'] * eta_g)
+        J['throttle', 'shaft_power_rating'] = - inputs['elec_power_required'] / (inputs['shaft_power_rating'] ** 2 * eta_g)
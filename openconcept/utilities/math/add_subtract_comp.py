@@ -235,26 +235,17 @@ class AddSubtractComp(ExplicitComponent):
             if isinstance(input_names, string_types):
                 input_names = [input_names]
 
-            if isinstance(vec_size, Iterable):
-                # scalar - vector mutliplication
-                vec_out_size = max(vec_size)
-            else:
-                vec_out_size = vec_size
-
             if scaling_factors is None:
                 scaling_factors = np.ones(len(input_names))
-            if length == 1:
-                shape = (vec_out_size,)
-            else:
-                shape = (vec_out_size, length)
-
-            if self.under_complex_step:
-                temp = np.zeros(shape, dtype=np.complex_)
-            else:
-                temp = np.zeros(shape)
 
+            # accumulate directly into the output vector rather than a temporary array
+            out = outputs[output_name]
+            out.fill(0.0)
             for i, input_name in enumerate(input_names):
                 sf = scaling_factors[i]
-                temp = temp + inputs[input_name] * sf
-
-            outputs[output_name] = temp
+                if sf == 1.0:
+                    out += inputs[input_name]
+                elif sf == -1.0:
+                    out -= inputs[input_name]
+                else:
+                    out += inputs[input_name] * sf
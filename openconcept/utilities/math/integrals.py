@@ -166,6 +166,17 @@ def multistep_integrator(q0, dqdt, dts, tri_mat, repeat_mat, segment_names=None,
     n = int(len(dqdt) / len(dts))
 
     n_segments = len(dts)
+    if n_segments == 1 and segment_names is None:
+        # a single segment (e.g. the Integrator component) needs no block assembly;
+        # the Jacobian is just the cached integration matrix scaled by the timestep
+        if not partials:
+            # apply the scalar timestep to the integrated vector, not the matrix
+            Q = tri_mat.dot(dqdt) * dts[0] + q0
+            return Q
+        dQdqdt = (tri_mat * dts[0]).asformat('csr')
+        dQddt = tri_mat.dot(dqdt)
+        return dQdqdt, [sp.csr_matrix(dQddt).transpose()]
+
     row_list = []
     for i in range(n_segments):
         col_list = []